@@ -1,7 +1,293 @@
 # backend/main.py
 
+import argparse
+import csv
+import json
+import sys
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from models.eligibility import EligibilityRules
 from models.pantry_system import PantrySystem
 
+# (field, table column width) for each kind of row the CLI can output
+INVENTORY_COLUMNS = [("name", 24), ("category", 18), ("quantity", 8)]
+RECIPIENT_COLUMNS = [("name", 24), ("household_size", 14), ("notes", 40)]
+HISTORY_COLUMNS = [
+    ("timestamp", 20),
+    ("recipient", 24),
+    ("item", 24),
+    ("quantity", 8),
+]
+REORDER_COLUMNS = [
+    ("name", 24),
+    ("quantity", 8),
+    ("daily_rate", 10),
+    ("days_until_stockout", 19),
+    ("suggested_reorder", 17),
+]
+STATS_COLUMNS = [("metric", 24), ("value", 20)]
+RULES_COLUMNS = [("rule", 32), ("value", 12)]
+
+
+# ---------- Streaming output ----------
+
+
+def write_rows(
+    rows: Iterable[Dict],
+    columns: List[Tuple[str, int]],
+    fmt: str,
+    out: TextIO,
+) -> int:
+    """
+    Write rows to out one at a time in table, csv or json format,
+    so output starts immediately and memory stays bounded.
+    Returns the number of rows written.
+    """
+    fields = [name for name, _ in columns]
+    count = 0
+
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+
+    elif fmt == "json":
+        # A JSON array written element by element.
+        out.write("[")
+        for row in rows:
+            out.write(",\n  " if count else "\n  ")
+            out.write(json.dumps({name: row.get(name) for name in fields}))
+            count += 1
+        out.write("\n]\n" if count else "]\n")
+
+    else:
+        out.write(" ".join(name.ljust(width) for name, width in columns).rstrip() + "\n")
+        out.write(" ".join("-" * width for _, width in columns) + "\n")
+        for row in rows:
+            cells = []
+            for name, width in columns:
+                value = row.get(name)
+                if isinstance(value, float):
+                    value = f"{value:.2f}"
+                cells.append(("" if value is None else str(value)).ljust(width))
+            out.write(" ".join(cells).rstrip() + "\n")
+            count += 1
+
+    return count
+
+
+# ---------- Queries ----------
+
+
+def iter_inventory(pantry: PantrySystem, category: Optional[str] = None) -> Iterator[Dict]:
+    for item in pantry.get_inventory():
+        if category is None or item.category == category:
+            yield item.to_dict()
+
+
+def iter_low_stock(pantry: PantrySystem, threshold: int) -> Iterator[Dict]:
+    for item in pantry.get_low_stock_items(threshold):
+        yield item.to_dict()
+
+
+def iter_recipients(pantry: PantrySystem) -> Iterator[Dict]:
+    for r in pantry.recipients:
+        yield {"name": r.name, "household_size": r.household_size, "notes": r.notes}
+
+
+def iter_history(
+    pantry: PantrySystem,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    recipient: Optional[str] = None,
+    item: Optional[str] = None,
+) -> Iterator[Dict]:
+    """
+    Yield history records with since <= timestamp < until.
+
+    History is appended in time order and ISO timestamps sort as
+    strings, so the start of the range is found by binary search and
+    iteration stops at the first record past the end.
+    """
+    history = pantry.history
+    start = 0
+    if since:
+        start = bisect_left(history, since, key=lambda r: r.get("timestamp", ""))
+
+    for index in range(start, len(history)):
+        record = history[index]
+        if until and record.get("timestamp", "") >= until:
+            break
+        if recipient and record.get("recipient") != recipient:
+            continue
+        if item and record.get("item") != item:
+            continue
+        yield record
+
+
+def iter_reorder(pantry: PantrySystem, lead_time_days: int, cover_days: int) -> Iterator[Dict]:
+    for f in pantry.get_reorder_suggestions(lead_time_days, cover_days):
+        yield {
+            "name": f.name,
+            "quantity": f.quantity,
+            "daily_rate": f.daily_rate,
+            "days_until_stockout": f.days_until_stockout,
+            "suggested_reorder": f.suggested_reorder,
+        }
+
+
+def iter_stats(pantry: PantrySystem, threshold: int) -> Iterator[Dict]:
+    inventory = pantry.get_inventory()
+    yield {"metric": "items", "value": len(inventory)}
+    yield {"metric": "units_in_stock", "value": sum(i.quantity for i in inventory)}
+    yield {"metric": "low_stock_items", "value": len(pantry.get_low_stock_items(threshold))}
+    yield {"metric": "recipients", "value": len(pantry.recipients)}
+
+    distributions = 0
+    units = 0
+    for record in pantry.history:
+        distributions += 1
+        try:
+            units += int(record["quantity"])
+        except (KeyError, TypeError, ValueError):
+            # Malformed record; counted as a distribution, not as units.
+            continue
+    yield {"metric": "distributions", "value": distributions}
+    yield {"metric": "units_distributed", "value": units}
+
+    if pantry.history:
+        yield {"metric": "first_distribution", "value": pantry.history[0].get("timestamp")}
+        yield {"metric": "last_distribution", "value": pantry.history[-1].get("timestamp")}
+
+
+def iter_rules(rules: EligibilityRules) -> Iterator[Dict]:
+    yield {"rule": "window_days", "value": rules.window_days}
+    yield {"rule": "max_visits", "value": rules.max_visits}
+    yield {"rule": "max_units_per_person", "value": rules.max_units_per_person}
+    for name, limit in rules.item_limits.items():
+        yield {"rule": f"item_limit:{name}", "value": limit}
+
+
+# ---------- Eligibility rules ----------
+
+
+def updated_rules(rules: EligibilityRules, args: argparse.Namespace) -> Optional[EligibilityRules]:
+    """
+    Return a copy of rules with the `rules` subcommand flags applied,
+    or None if no flags were given.
+    """
+    changed = EligibilityRules.from_dict(rules.to_dict())
+
+    if args.window_days is not None:
+        changed.window_days = args.window_days
+    if args.unlimited_visits:
+        changed.max_visits = None
+    elif args.max_visits is not None:
+        changed.max_visits = args.max_visits
+    if args.unlimited_units:
+        changed.max_units_per_person = None
+    elif args.max_units_per_person is not None:
+        changed.max_units_per_person = args.max_units_per_person
+    for name, limit in args.item_limit:
+        changed.item_limits[name] = limit
+    for name in args.remove_item_limit:
+        changed.item_limits.pop(name, None)
+
+    return None if changed == rules else changed
+
+
+# ---------- Imports ----------
+
+
+def read_records(path: Path) -> Iterator[Dict]:
+    """
+    Yield records from a .csv, .jsonl or .json (array of objects) file.
+    CSV and JSON Lines files are read one row at a time.
+    """
+    suffix = path.suffix.lower()
+    with path.open(encoding="utf-8", newline="") as f:
+        if suffix == ".csv":
+            yield from csv.DictReader(f)
+        elif suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif suffix == ".json":
+            yield from json.load(f)
+        else:
+            raise ValueError(f"Unsupported import file type '{suffix}'.")
+
+
+def field_or_default(data: Dict, key: str, default):
+    """Return data[key], or default only if it is missing, None or blank."""
+    value = data.get(key)
+    if value is None or value == "":
+        return default
+    return value
+
+
+def import_records(pantry: PantrySystem, kind: str, path: Path) -> Tuple[int, List[str]]:
+    """
+    Add inventory items or recipients from a file.
+    Returns (number imported, list of error messages for skipped rows).
+    """
+    imported = 0
+    errors = []
+    for line_no, data in enumerate(read_records(path), start=1):
+        try:
+            if kind == "inventory":
+                pantry.add_item(
+                    data["name"], data["category"], int(field_or_default(data, "quantity", 0))
+                )
+            elif pantry.get_recipient(data["name"]) is not None:
+                errors.append(f"record {line_no}: recipient '{data['name']}' already exists")
+                continue
+            else:
+                pantry.add_recipient(
+                    data["name"],
+                    int(field_or_default(data, "household_size", 1)),
+                    field_or_default(data, "notes", ""),
+                )
+        except (KeyError, TypeError, ValueError) as e:
+            errors.append(f"record {line_no}: {e}")
+            continue
+        imported += 1
+    return imported, errors
+
+
+# ---------- Compaction ----------
+
+
+def compact(pantry: PantrySystem, before: str) -> Tuple[int, int]:
+    """
+    Drop history records with timestamp < before, and recipient receipts
+    older than both before and the eligibility window (the visit/unit
+    limits are rebuilt from receipts, so those inside it are kept).
+    Returns (history records removed, receipts removed).
+    """
+    history = pantry.history
+    cut = bisect_left(history, before, key=lambda r: r.get("timestamp", ""))
+    del history[:cut]
+
+    window_start = datetime.now() - timedelta(days=pantry.eligibility.rules.window_days)
+    receipts_before = min(before, window_start.isoformat(timespec="seconds"))
+
+    receipts = 0
+    for r in pantry.recipients:
+        kept = [e for e in r.received_items if e.get("timestamp", "") >= receipts_before]
+        receipts += len(r.received_items) - len(kept)
+        r.received_items = kept
+
+    return cut, receipts
+
+
+# ---------- Demo ----------
+
 
 def print_inventory(pantry: PantrySystem) -> None:
     print("\nCurrent Inventory:")
@@ -17,13 +303,12 @@ def print_history(pantry: PantrySystem) -> None:
     for record in pantry.history:
         print(
             f"- {record.get('timestamp', '')}: "
-            f"{record['recipient']} received {record['quantity']} of {record['item']}"
+            f"{record.get('recipient', '?')} received {record.get('quantity', '?')} "
+            f"of {record.get('item', '?')}"
         )
 
 
-def main() -> None:
-    pantry = PantrySystem(data_file="pantry_data.json", auto_load=True)
-
+def run_demo(pantry: PantrySystem) -> None:
     # If starting fresh, add a little sample data:
     if not pantry.inventory:
         pantry.add_item("Rice", "Grains", 50)
@@ -45,5 +330,218 @@ def main() -> None:
     print_history(pantry)
 
 
+# ---------- Command line ----------
+
+
+def valid_timestamp(value: str) -> str:
+    """
+    argparse type: an ISO date or datetime, normalised to the
+    YYYY-MM-DDTHH:MM:SS local-time form used by stored timestamps
+    so that string comparisons against them are correct.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO date/time: '{value}'")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat(timespec="seconds")
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type: an integer >= 0."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: '{value}'")
+    return number
+
+
+def item_limit(value: str) -> Tuple[str, int]:
+    """argparse type: ITEM=UNITS, a per-person unit limit for one item."""
+    name, sep, limit = value.rpartition("=")
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"expected ITEM=UNITS, got '{value}'")
+    return name, non_negative_int(limit)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Food pantry command line tools (no GUI required)."
+    )
+    parser.add_argument(
+        "--data-file", default="pantry_data.json", help="pantry JSON data file"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["table", "csv", "json"],
+        default="table",
+        help="output format (default: table)",
+    )
+
+    # Lets --format also follow the subcommand. SUPPRESS keeps the
+    # subcommand from overwriting a --format given before it.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--format",
+        choices=["table", "csv", "json"],
+        default=argparse.SUPPRESS,
+        help="output format (default: table)",
+    )
+
+    sub = parser.add_subparsers(dest="command", metavar="command")
+
+    p = sub.add_parser("inventory", parents=[common], help="list inventory items")
+    p.add_argument("--category", help="only items in this category")
+
+    p = sub.add_parser("low-stock", parents=[common], help="list items at or below a threshold")
+    p.add_argument("--threshold", type=int, default=5)
+
+    p = sub.add_parser("recipients", parents=[common], help="list recipients")
+
+    p = sub.add_parser("history", parents=[common], help="query distribution history")
+    p.add_argument("--since", type=valid_timestamp, help="start date/time (inclusive)")
+    p.add_argument("--until", type=valid_timestamp, help="end date/time (exclusive)")
+    p.add_argument("--recipient", help="only this recipient")
+    p.add_argument("--item", help="only this item")
+
+    p = sub.add_parser("reorder", parents=[common], help="ranked reorder suggestions from demand forecast")
+    p.add_argument("--lead-time-days", type=int, default=7)
+    p.add_argument("--cover-days", type=int, default=7)
+
+    p = sub.add_parser("stats", parents=[common], help="summary statistics")
+    p.add_argument("--threshold", type=int, default=5, help="low-stock threshold")
+
+    p = sub.add_parser("import", parents=[common], help="import inventory or recipients from a file")
+    p.add_argument("kind", choices=["inventory", "recipients"])
+    p.add_argument("file", type=Path, help=".csv, .jsonl or .json file")
+
+    p = sub.add_parser("export", parents=[common], help="export inventory, recipients or history")
+    p.add_argument("kind", choices=["inventory", "recipients", "history"])
+    p.add_argument("-o", "--output", type=Path, help="write to file instead of stdout")
+
+    p = sub.add_parser("rules", parents=[common], help="show or change eligibility rules")
+    p.add_argument("--window-days", type=non_negative_int, help="rolling window length in days")
+    p.add_argument("--max-visits", type=non_negative_int, help="visits allowed per window")
+    p.add_argument("--unlimited-visits", action="store_true", help="remove the visit limit")
+    p.add_argument(
+        "--max-units-per-person",
+        type=non_negative_int,
+        help="units of any one item per household member per window",
+    )
+    p.add_argument("--unlimited-units", action="store_true", help="remove the default unit limit")
+    p.add_argument(
+        "--item-limit",
+        type=item_limit,
+        action="append",
+        default=[],
+        metavar="ITEM=UNITS",
+        help="per-person unit limit for one item (repeatable)",
+    )
+    p.add_argument(
+        "--remove-item-limit",
+        action="append",
+        default=[],
+        metavar="ITEM",
+        help="drop an item's own limit (repeatable)",
+    )
+
+    p = sub.add_parser("compact", parents=[common], help="drop history older than a date")
+    p.add_argument("--before", type=valid_timestamp, required=True)
+
+    sub.add_parser("demo", parents=[common], help="seed sample data and record a sample distribution")
+
+    return parser
+
+
+def run(args: argparse.Namespace, out: TextIO) -> int:
+    pantry = PantrySystem(data_file=args.data_file, auto_load=True)
+
+    if args.command == "inventory":
+        write_rows(iter_inventory(pantry, args.category), INVENTORY_COLUMNS, args.format, out)
+
+    elif args.command == "low-stock":
+        write_rows(iter_low_stock(pantry, args.threshold), INVENTORY_COLUMNS, args.format, out)
+
+    elif args.command == "recipients":
+        write_rows(iter_recipients(pantry), RECIPIENT_COLUMNS, args.format, out)
+
+    elif args.command == "history":
+        rows = iter_history(pantry, args.since, args.until, args.recipient, args.item)
+        write_rows(rows, HISTORY_COLUMNS, args.format, out)
+
+    elif args.command == "reorder":
+        rows = iter_reorder(pantry, args.lead_time_days, args.cover_days)
+        write_rows(rows, REORDER_COLUMNS, args.format, out)
+
+    elif args.command == "stats":
+        write_rows(iter_stats(pantry, args.threshold), STATS_COLUMNS, args.format, out)
+
+    elif args.command == "import":
+        try:
+            imported, errors = import_records(pantry, args.kind, args.file)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] {e}", file=sys.stderr)
+            return 1
+        pantry.save_data()
+        for message in errors:
+            print(f"[SKIPPED] {message}", file=sys.stderr)
+        print(f"Imported {imported} {args.kind} record(s).", file=sys.stderr)
+        return 1 if errors else 0
+
+    elif args.command == "export":
+        rows, columns = {
+            "inventory": (iter_inventory(pantry), INVENTORY_COLUMNS),
+            "recipients": (iter_recipients(pantry), RECIPIENT_COLUMNS),
+            "history": (iter_history(pantry), HISTORY_COLUMNS),
+        }[args.kind]
+        if args.output:
+            with args.output.open("w", encoding="utf-8", newline="") as f:
+                count = write_rows(rows, columns, args.format, f)
+            print(f"Exported {count} {args.kind} record(s) to {args.output}.", file=sys.stderr)
+        else:
+            write_rows(rows, columns, args.format, out)
+
+    elif args.command == "rules":
+        rules = updated_rules(pantry.eligibility.rules, args)
+        if rules is not None:
+            if rules.window_days <= 0:
+                print("[ERROR] --window-days must be positive.", file=sys.stderr)
+                return 1
+            pantry.set_eligibility_rules(rules)
+        write_rows(iter_rules(pantry.eligibility.rules), RULES_COLUMNS, args.format, out)
+
+    elif args.command == "compact":
+        removed, receipts = compact(pantry, args.before)
+        pantry.save_data()
+        print(
+            f"Removed {removed} history record(s) and {receipts} receipt(s) "
+            f"before {args.before}.",
+            file=sys.stderr,
+        )
+
+    elif args.command == "demo":
+        run_demo(pantry)
+
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+
+    try:
+        return run(args, sys.stdout)
+    except BrokenPipeError:
+        # Output piped into e.g. `head` that exited early.
+        sys.stderr.close()
+        return 0
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
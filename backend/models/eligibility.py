@@ -0,0 +1,169 @@
+# backend/models/eligibility.py
+
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from typing import Deque, Dict, Optional, Tuple
+
+
+@dataclass
+class EligibilityRules:
+    """
+    Pantry policy for how much a household may receive in a rolling window.
+
+    - max_visits: visits allowed per window (None = unlimited).
+      All distributions on the same calendar day count as one visit.
+    - max_units_per_person: units of any single item allowed per window,
+      per household member (None = unlimited).
+    - item_limits: per-item overrides of max_units_per_person.
+    """
+
+    window_days: int = 30
+    max_visits: Optional[int] = None
+    max_units_per_person: Optional[int] = None
+    item_limits: Dict[str, int] = field(default_factory=dict)
+
+    def unit_limit(self, item_name: str, household_size: int) -> Optional[int]:
+        """
+        Return the unit limit for one item for a household of the given size,
+        or None if the item is not limited.
+        """
+        per_person = self.item_limits.get(item_name, self.max_units_per_person)
+        if per_person is None:
+            return None
+        return per_person * household_size
+
+    def to_dict(self) -> dict:
+        """
+        Convert these rules to a plain dict for JSON storage.
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EligibilityRules":
+        """
+        Create EligibilityRules from a dict (inverse of to_dict).
+        """
+        return cls(
+            window_days=data.get("window_days", 30),
+            max_visits=data.get("max_visits"),
+            max_units_per_person=data.get("max_units_per_person"),
+            item_limits=dict(data.get("item_limits", {})),
+        )
+
+
+class _SlidingWindow:
+    """
+    Running total of (time, amount) entries inside a time window.
+    Entries are appended in time order and dropped from the front
+    lazily, so each entry is added and expired at most once.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Deque[Tuple[datetime, int]] = deque()
+        self.total = 0
+
+    def add(self, when: datetime, amount: int) -> None:
+        self.entries.append((when, amount))
+        self.total += amount
+
+    def expire(self, cutoff: datetime) -> int:
+        entries = self.entries
+        while entries and entries[0][0] <= cutoff:
+            self.total -= entries.popleft()[1]
+        return self.total
+
+
+class EligibilityTracker:
+    """
+    Keeps sliding-window counters per recipient (visits) and per
+    (recipient, item) (units), so intake checks do not have to scan
+    Recipient.received_items.
+    """
+
+    def __init__(self, rules: Optional[EligibilityRules] = None) -> None:
+        self.rules = rules or EligibilityRules()
+        self._visits: Dict[str, _SlidingWindow] = {}
+        self._last_visit_day: Dict[str, str] = {}
+        self._units: Dict[Tuple[str, str], _SlidingWindow] = {}
+
+    def clear(self) -> None:
+        self._visits.clear()
+        self._last_visit_day.clear()
+        self._units.clear()
+
+    def _cutoff(self, now: datetime) -> datetime:
+        return now - timedelta(days=self.rules.window_days)
+
+    def record(
+        self, recipient_name: str, item_name: str, quantity: int, when: datetime
+    ) -> None:
+        """
+        Count a distribution against the recipient's windows.
+        Distributions must be recorded in time order. Limits that are
+        not configured are not tracked, and expired entries are dropped
+        as new ones arrive so the windows stay bounded.
+        """
+        cutoff = self._cutoff(when)
+
+        if self.rules.max_visits is not None:
+            day = when.date().isoformat()
+            if self._last_visit_day.get(recipient_name) != day:
+                self._last_visit_day[recipient_name] = day
+                window = self._visits.setdefault(recipient_name, _SlidingWindow())
+                window.expire(cutoff)
+                window.add(when, 1)
+
+        if self.rules.unit_limit(item_name, 1) is not None:
+            window = self._units.setdefault((recipient_name, item_name), _SlidingWindow())
+            window.expire(cutoff)
+            window.add(when, quantity)
+
+    def visits_in_window(self, recipient_name: str, now: datetime) -> int:
+        window = self._visits.get(recipient_name)
+        if window is None:
+            return 0
+        return window.expire(self._cutoff(now))
+
+    def units_in_window(
+        self, recipient_name: str, item_name: str, now: datetime
+    ) -> int:
+        window = self._units.get((recipient_name, item_name))
+        if window is None:
+            return 0
+        return window.expire(self._cutoff(now))
+
+    def check(
+        self,
+        recipient_name: str,
+        household_size: int,
+        item_name: str,
+        quantity: int,
+        now: datetime,
+    ) -> Optional[str]:
+        """
+        Return None if the distribution is allowed, otherwise a message
+        explaining which limit it would exceed.
+        """
+        rules = self.rules
+
+        if rules.max_visits is not None:
+            same_day = self._last_visit_day.get(recipient_name) == now.date().isoformat()
+            visits = self.visits_in_window(recipient_name, now)
+            if not same_day and visits >= rules.max_visits:
+                return (
+                    f"'{recipient_name}' has reached the limit of "
+                    f"{rules.max_visits} visits in {rules.window_days} days."
+                )
+
+        limit = rules.unit_limit(item_name, household_size)
+        if limit is not None:
+            used = self.units_in_window(recipient_name, item_name, now)
+            if used + quantity > limit:
+                return (
+                    f"'{recipient_name}' may receive at most {limit} of "
+                    f"'{item_name}' in {rules.window_days} days. "
+                    f"Already received: {used}, requested: {quantity}"
+                )
+
+        return None
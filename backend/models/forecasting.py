@@ -0,0 +1,265 @@
+# backend/models/forecasting.py
+
+import math
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from .item import Item
+
+
+@dataclass
+class ItemForecast:
+    """
+    Projected demand for one inventory item.
+    days_until_stockout is None when there is no recent demand, or
+    less than MIN_HISTORY_DAYS of it to go on.
+    """
+
+    name: str
+    category: str
+    quantity: int
+    daily_rate: float
+    days_until_stockout: Optional[int]
+    suggested_reorder: int = 0
+
+
+@dataclass
+class _DemandState:
+    """
+    Incremental demand state for one item.
+
+    Units given out on the current (open) day are accumulated in
+    day_total and folded into the averages once the day is over.
+    Averages start from zero and count the days folded into them,
+    so they can be bias-corrected (see _corrected).
+    """
+
+    day: Optional[date] = None
+    day_total: int = 0
+    rate: float = 0.0
+    days: int = 0
+    # EWMA of daily units for each weekday (Monday = 0)
+    weekday: List[float] = field(default_factory=lambda: [0.0] * 7)
+    weekday_days: List[int] = field(default_factory=lambda: [0] * 7)
+
+
+def _ewma(previous: float, value: float, alpha: float) -> float:
+    return alpha * value + (1 - alpha) * previous
+
+
+def _corrected(average: float, alpha: float, days: int) -> float:
+    """
+    Remove the pull towards the zero starting value from an EWMA
+    that has had `days` values folded in.
+    """
+    if days <= 0:
+        return 0.0
+    return average / (1 - (1 - alpha) ** days)
+
+
+class DemandForecaster:
+    """
+    Per-item consumption rates from distribution history.
+
+    - Overall daily rate: exponentially weighted moving average (alpha)
+    - Day-of-week seasonality: one EWMA per weekday (seasonal_alpha)
+
+    State is updated as distributions are recorded, so producing a
+    forecast never rescans history.
+    """
+
+    # After this many days without demand the averages are reset
+    # instead of being decayed one day at a time.
+    MAX_GAP_DAYS = 8 * 7
+
+    # Days of history needed before an item is forecast at all; a week
+    # gives every weekday at least one observation.
+    MIN_HISTORY_DAYS = 7
+
+    # Float rounding allowance when comparing projected demand to stock.
+    EPSILON = 1e-9
+
+    def __init__(self, alpha: float = 0.2, seasonal_alpha: float = 0.3) -> None:
+        self.alpha = alpha
+        self.seasonal_alpha = seasonal_alpha
+        self._states: Dict[str, _DemandState] = {}
+
+    def clear(self) -> None:
+        self._states.clear()
+
+    def _fold_day(self, state: _DemandState, day: date, total: int) -> None:
+        state.rate = _ewma(state.rate, total, self.alpha)
+        state.days += 1
+        dow = day.weekday()
+        state.weekday[dow] = _ewma(state.weekday[dow], total, self.seasonal_alpha)
+        state.weekday_days[dow] += 1
+
+    def _advance(self, state: _DemandState, to_day: date) -> None:
+        """
+        Close every day before to_day, folding in zero-demand days
+        for any gap, and open to_day.
+        """
+        if state.day is None or to_day <= state.day:
+            if state.day is None:
+                state.day = to_day
+            return
+
+        self._fold_day(state, state.day, state.day_total)
+        gap = (to_day - state.day).days - 1
+        if gap > self.MAX_GAP_DAYS:
+            # Start over exactly like a new item.
+            fresh = _DemandState()
+            state.rate, state.days = fresh.rate, fresh.days
+            state.weekday, state.weekday_days = fresh.weekday, fresh.weekday_days
+        else:
+            for offset in range(1, gap + 1):
+                self._fold_day(state, state.day + timedelta(days=offset), 0)
+
+        state.day = to_day
+        state.day_total = 0
+
+    def record(self, item_name: str, quantity: int, when: datetime) -> None:
+        """
+        Add a distribution to the item's demand.
+        Distributions are expected in time order; late ones count
+        towards the current day.
+        """
+        state = self._states.setdefault(item_name, _DemandState())
+        self._advance(state, when.date())
+        state.day_total += quantity
+
+    def load_history(self, history: Iterable[Dict]) -> None:
+        """
+        Rebuild all demand state from distribution history records.
+        """
+        self.clear()
+        for record in history:
+            try:
+                when = datetime.fromisoformat(record["timestamp"])
+                item_name = record["item"]
+                quantity = int(record["quantity"])
+            except (KeyError, TypeError, ValueError):
+                # Malformed record; skip it rather than fail the load.
+                continue
+            self.record(item_name, quantity, when)
+
+    def _projected(self, state: _DemandState, today: date) -> _DemandState:
+        """
+        Return a copy of state advanced to today. Forecasting must not
+        change the stored state; only record() moves it forward.
+        """
+        projected = replace(
+            state,
+            weekday=list(state.weekday),
+            weekday_days=list(state.weekday_days),
+        )
+        self._advance(projected, today)
+        return projected
+
+    def _seasonal_factors(self, state: _DemandState) -> List[float]:
+        """
+        Weekday demand relative to the weekday mean (averages to 1.0).
+        Only called with MIN_HISTORY_DAYS of history, so every weekday
+        has been observed.
+        """
+        averages = [
+            _corrected(w, self.seasonal_alpha, n)
+            for w, n in zip(state.weekday, state.weekday_days)
+        ]
+        mean = sum(averages) / 7
+        if mean <= 0:
+            return [1.0] * 7
+        return [a / mean for a in averages]
+
+    def _days_until_stockout(
+        self, quantity: int, rate: float, factors: List[float], today: date
+    ) -> Optional[int]:
+        if rate <= 0:
+            return None
+        if quantity <= 0:
+            return 0
+
+        # Seasonal factors average to 1, so a full week uses 7 * rate.
+        weekly = 7 * rate
+        weeks = int(quantity // weekly)
+        remaining = quantity - weeks * weekly
+        days = weeks * 7
+
+        dow = today.weekday()
+        while remaining > self.EPSILON:
+            days += 1
+            remaining -= rate * factors[(dow + days) % 7]
+            if days - weeks * 7 > 14:
+                # Only possible if every factor is zero; treat as no demand.
+                return None
+        return days
+
+    def forecast(
+        self,
+        items: Iterable[Item],
+        today: Optional[date] = None,
+        lead_time_days: int = 7,
+        cover_days: int = 7,
+    ) -> List[ItemForecast]:
+        """
+        Forecast every item in one pass.
+
+        suggested_reorder is the amount needed so that stock covers
+        the expected demand over lead_time_days + cover_days.
+        """
+        today = today or date.today()
+        horizon = lead_time_days + cover_days
+        results = []
+
+        for item in items:
+            state = self._states.get(item.name)
+            rate = 0.0
+            factors = [1.0] * 7
+            if state is not None:
+                state = self._projected(state, today)
+                if state.days >= self.MIN_HISTORY_DAYS:
+                    rate = _corrected(state.rate, self.alpha, state.days)
+                    factors = self._seasonal_factors(state)
+
+            dow = today.weekday()
+            demand = rate * sum(factors[(dow + d) % 7] for d in range(1, horizon + 1))
+            shortfall = demand - item.quantity - self.EPSILON
+
+            results.append(
+                ItemForecast(
+                    name=item.name,
+                    category=item.category,
+                    quantity=item.quantity,
+                    daily_rate=rate,
+                    days_until_stockout=self._days_until_stockout(
+                        item.quantity, rate, factors, today
+                    ),
+                    suggested_reorder=max(0, math.ceil(shortfall)),
+                )
+            )
+
+        return results
+
+    def reorder_list(
+        self,
+        items: Iterable[Item],
+        today: Optional[date] = None,
+        lead_time_days: int = 7,
+        cover_days: int = 7,
+    ) -> List[ItemForecast]:
+        """
+        Items that need reordering, soonest stockout first.
+        """
+        suggestions = [
+            f
+            for f in self.forecast(items, today, lead_time_days, cover_days)
+            if f.suggested_reorder > 0
+        ]
+        suggestions.sort(
+            key=lambda f: (
+                f.days_until_stockout if f.days_until_stockout is not None else math.inf,
+                -f.suggested_reorder,
+            )
+        )
+        return suggestions
@@ -60,9 +60,11 @@
 
 import json
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Dict, Optional
 
+from .eligibility import EligibilityRules, EligibilityTracker
+from .forecasting import DemandForecaster, ItemForecast
 from .item import Item
 from .recipient import Recipient
 
@@ -74,13 +76,19 @@ class PantrySystem:
     - Manages inventory (Items)
     - Manages recipients (Recipients)
     - Records distributions
+    - Enforces per-household eligibility rules (visit/unit limits)
+    - Forecasts demand and suggests reorders
+    - Notifies listeners of changes (so the GUI can refresh in place)
     - Can save/load all data to/from a JSON file
 
     NOTE: This version is aligned with the Tkinter GUI in frontend/app.py.
     """
 
     def __init__(
-        self, data_file: str = "pantry_data.json", auto_load: bool = True
+        self,
+        data_file: str = "pantry_data.json",
+        auto_load: bool = True,
+        eligibility_rules: Optional[EligibilityRules] = None,
     ) -> None:
         self.data_file = Path(data_file)
 
@@ -94,6 +102,15 @@ class PantrySystem:
         # each entry: {"recipient", "item", "quantity", "timestamp"}
         self.history: List[Dict] = []
 
+        # sliding-window visit/unit counters, rebuilt on load
+        self.eligibility = EligibilityTracker(eligibility_rules)
+
+        # per-item demand averages, updated on every distribution
+        self.forecaster = DemandForecaster()
+
+        # change listeners, called as listener(event, key); see subscribe()
+        self._listeners: List[Callable[[str, Any], None]] = []
+
         if auto_load:
             self.load_data()
 
@@ -107,6 +124,28 @@ class PantrySystem:
         """
         return list(self.inventory.values())
 
+    # ---------- Change notifications ----------
+
+    def subscribe(self, listener: Callable[[str, Any], None]) -> None:
+        """
+        Register a callback for data changes. It is called as
+        listener(event, key) with one of:
+        - ("item", item name): item added or quantity changed
+        - ("recipient", recipient name): recipient added
+        - ("distribution", history record dict): distribution recorded
+        - ("reload", None): everything was reloaded from disk
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, Any], None]) -> None:
+        """Remove a callback registered with subscribe()."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event: str, key: Any = None) -> None:
+        for listener in list(self._listeners):
+            listener(event, key)
+
     # ---------- Helper lookups ----------
 
     def get_item(self, name: str) -> Optional[Item]:
@@ -135,6 +174,7 @@ class PantrySystem:
             existing.update_quantity(quantity)
         else:
             self.inventory[name] = Item(name=name, category=category, quantity=quantity)
+        self._notify("item", name)
 
     def update_item_quantity(self, name: str, amount: int) -> None:
         """
@@ -145,6 +185,7 @@ class PantrySystem:
         if not item:
             raise KeyError(f"Item '{name}' not found in inventory.")
         item.update_quantity(amount)
+        self._notify("item", name)
 
     def get_inventory(self) -> List[Item]:
         """
@@ -160,6 +201,32 @@ class PantrySystem:
         """
         return [item for item in self.inventory.values() if item.quantity <= threshold]
 
+    def get_forecast(self) -> List[ItemForecast]:
+        """
+        Return a demand forecast for every item in inventory
+        (daily rate and days until stockout).
+        """
+        return self.forecaster.forecast(self.inventory.values())
+
+    def get_item_forecast(self, name: str) -> Optional[ItemForecast]:
+        """Return the demand forecast for a single item, or None if not found."""
+        item = self.get_item(name)
+        if not item:
+            return None
+        return self.forecaster.forecast([item])[0]
+
+    def get_reorder_suggestions(
+        self, lead_time_days: int = 7, cover_days: int = 7
+    ) -> List[ItemForecast]:
+        """
+        Return items that should be reordered, soonest stockout first.
+        """
+        return self.forecaster.reorder_list(
+            self.inventory.values(),
+            lead_time_days=lead_time_days,
+            cover_days=cover_days,
+        )
+
     # ---------- Recipient management ----------
 
     def add_recipient(self, name: str, household_size: int, notes: str = "") -> None:
@@ -175,6 +242,7 @@ class PantrySystem:
         self.recipients.append(
             Recipient(name=name, household_size=household_size, notes=notes)
         )
+        self._notify("recipient", name)
 
     def get_all_recipients(self) -> List[Dict]:
         """
@@ -182,18 +250,37 @@ class PantrySystem:
         """
         return [r.to_dict() for r in self.recipients]
 
-    # ---------- Distribution management ----------
+    # ---------- Eligibility ----------
 
-    def record_distribution(
+    def set_eligibility_rules(self, rules: EligibilityRules) -> None:
+        """
+        Replace the eligibility rules, rebuild the counters for them,
+        and save (the rules are stored in the data file).
+        """
+        self.eligibility.rules = rules
+        self._rebuild_eligibility()
+        self.save_data()
+
+    def check_eligibility(
         self, item_name: str, recipient_name: str, quantity: int
     ) -> str:
         """
-        Record that some quantity of an item was given to a recipient.
+        Check a distribution without recording it: the same validation
+        and eligibility rules as record_distribution.
+        Returns "SUCCESS" if allowed, otherwise an error message string
+        (same convention as record_distribution).
+        """
+        problem = self._distribution_problem(
+            item_name, recipient_name, quantity, datetime.now()
+        )
+        return problem or "SUCCESS"
 
-        This method is designed to match the GUI usage:
-        - Returns "SUCCESS" on success
-        - Returns an error message string on failure
-        (instead of raising exceptions)
+    def _distribution_problem(
+        self, item_name: str, recipient_name: str, quantity: int, now: datetime
+    ) -> Optional[str]:
+        """
+        Return None if the distribution can be made, otherwise the
+        error message explaining why not.
         """
         if quantity <= 0:
             return "Quantity must be positive."
@@ -212,7 +299,58 @@ class PantrySystem:
                 f"Available: {item.quantity}, requested: {quantity}"
             )
 
-        timestamp = datetime.now().isoformat(timespec="seconds")
+        return self.eligibility.check(
+            recipient_name=recipient_name,
+            household_size=recipient.household_size,
+            item_name=item_name,
+            quantity=quantity,
+            now=now,
+        )
+
+    def _rebuild_eligibility(self) -> None:
+        """
+        Reload the eligibility counters from each recipient's received_items.
+        Only entries still inside the rules window are kept.
+        """
+        self.eligibility.clear()
+        cutoff = datetime.now() - timedelta(days=self.eligibility.rules.window_days)
+        for recipient in self.recipients:
+            for entry in recipient.received_items:
+                try:
+                    when = datetime.fromisoformat(entry["timestamp"])
+                    if when.tzinfo is not None:
+                        # Stored timestamps are local time without an offset.
+                        when = when.astimezone().replace(tzinfo=None)
+                    item_name = entry["item_name"]
+                    quantity = int(entry["quantity"])
+                except (KeyError, TypeError, ValueError):
+                    # Malformed receipt; skip it rather than fail the load.
+                    continue
+                if when <= cutoff:
+                    continue
+                self.eligibility.record(recipient.name, item_name, quantity, when)
+
+    # ---------- Distribution management ----------
+
+    def record_distribution(
+        self, item_name: str, recipient_name: str, quantity: int
+    ) -> str:
+        """
+        Record that some quantity of an item was given to a recipient.
+
+        This method is designed to match the GUI usage:
+        - Returns "SUCCESS" on success
+        - Returns an error message string on failure
+        (instead of raising exceptions)
+        """
+        now = datetime.now().replace(microsecond=0)
+        problem = self._distribution_problem(item_name, recipient_name, quantity, now)
+        if problem:
+            return problem
+
+        item = self.get_item(item_name)
+        recipient = self.get_recipient(recipient_name)
+        timestamp = now.isoformat(timespec="seconds")
 
         # Perform the distribution
         try:
@@ -223,6 +361,8 @@ class PantrySystem:
         recipient.record_receipt(
             item_name=item_name, quantity=quantity, timestamp=timestamp
         )
+        self.eligibility.record(recipient_name, item_name, quantity, now)
+        self.forecaster.record(item_name, quantity, now)
 
         record = {
             "recipient": recipient_name,
@@ -235,18 +375,22 @@ class PantrySystem:
         # Optionally auto-save on every distribution:
         self.save_data()
 
+        self._notify("item", item_name)
+        self._notify("distribution", record)
+
         return "SUCCESS"
 
     # ---------- Persistence (JSON save/load) ----------
 
     def save_data(self) -> None:
         """
-        Save inventory, recipients, and history to a JSON file.
+        Save inventory, recipients, history, and eligibility rules to a JSON file.
         """
         data = {
             "inventory": [item.to_dict() for item in self.inventory.values()],
             "recipients": [r.to_dict() for r in self.recipients],
             "history": self.history,
+            "eligibility_rules": self.eligibility.rules.to_dict(),
         }
 
         self.data_file.write_text(
@@ -258,6 +402,8 @@ class PantrySystem:
         """
         Load inventory, recipients, and history from a JSON file, if it exists.
         If not, start with empty data.
+        Eligibility rules stored in the file replace the ones passed to
+        the constructor; files without rules keep the current ones.
         """
         if not self.data_file.exists():
             return
@@ -284,3 +430,11 @@ class PantrySystem:
             self.recipients.append(Recipient.from_dict(rec_data))
 
         self.history.extend(data.get("history", []))
+
+        if "eligibility_rules" in data:
+            self.eligibility.rules = EligibilityRules.from_dict(data["eligibility_rules"])
+
+        self._rebuild_eligibility()
+        self.forecaster.load_history(self.history)
+
+        self._notify("reload")
@@ -1,5 +1,6 @@
 import sys
 import os
+from datetime import datetime, timedelta
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import tkinter as tk
@@ -14,7 +15,26 @@ class PantryApp:
         self.root = root
         self.root.title("Food Pantry Inventory System")
         self.root.geometry("600x520")
+        self.root.configure(bg="#FFF7EE")
         self.system = PantrySystem()
+
+        # Every screen is built once and stacked in the same grid cell;
+        # navigation just raises the requested one.
+        self.container = tk.Frame(self.root, bg="#FFF7EE")
+        self.container.pack(fill="both", expand=True)
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
+
+        self.screens = {}
+        self.build_main_menu_screen()
+        self.build_add_item_screen()
+        self.build_add_recipient_screen()
+        self.build_inventory_screen()
+        self.build_distribution_screen()
+        self.build_history_screen()
+
+        self.system.subscribe(self.on_pantry_change)
+        self.schedule_day_rollover()
         self.build_main_menu()
 
     def add_hover_effect(self, widget, normal_bg, hover_bg):
@@ -30,11 +50,42 @@ class PantryApp:
         widget.bind("<Enter>", on_enter)
         widget.bind("<Leave>", on_leave)
 
-    def build_main_menu(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
-        self.root.configure(bg="#FFF7EE")
+    def new_screen(self, name):
+        screen = tk.Frame(self.container, bg="#FFF7EE")
+        screen.grid(row=0, column=0, sticky="nsew")
+        self.screens[name] = screen
+        return screen
+
+    def show_screen(self, name):
+        self.screens[name].tkraise()
+
+    def schedule_day_rollover(self):
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        delay_ms = int((midnight - now).total_seconds() * 1000) + 1000
+        self.root.after(delay_ms, self.on_day_rollover)
+
+    def on_day_rollover(self):
+        # Days-left figures depend on the date as well as on item changes.
+        self.refresh_inventory_forecasts()
+        self.schedule_day_rollover()
+
+    def on_pantry_change(self, event, key):
+        if event == "item":
+            self.refresh_inventory_row(key)
+            self.add_combobox_value(self.item_combo, key)
+        elif event == "recipient":
+            self.add_combobox_value(self.recipient_combo, key)
+        elif event == "distribution":
+            self.append_history_row(key)
+        elif event == "reload":
+            self.reload_data_views()
+        self.update_distribution_state()
+
+    # ---------- Main menu ----------
+
+    def build_main_menu_screen(self):
+        screen = self.new_screen("main")
 
         logo_path = os.path.join(os.path.dirname(__file__), "assets", "logo.png")
         if os.path.exists(logo_path):
@@ -44,7 +95,7 @@ class PantryApp:
         else:
             self.logo_photo = None
 
-        header = tk.Frame(self.root, bg="#FFF7EE")
+        header = tk.Frame(screen, bg="#FFF7EE")
         header.pack(pady=20)
 
         if self.logo_photo:
@@ -68,34 +119,36 @@ class PantryApp:
             "height": 1
         }
 
-        btn1 = tk.Button(self.root, text="Add Donation / Item", command=self.open_add_item_screen, **btn_style)
+        btn1 = tk.Button(screen, text="Add Donation / Item", command=self.open_add_item_screen, **btn_style)
         btn1.pack(pady=8)
         self.add_hover_effect(btn1, "#FF8C42", "#e6762f")
 
-        btn2 = tk.Button(self.root, text="Add Recipient", command=self.open_add_recipient_screen, **btn_style)
+        btn2 = tk.Button(screen, text="Add Recipient", command=self.open_add_recipient_screen, **btn_style)
         btn2.pack(pady=8)
         self.add_hover_effect(btn2, "#FF8C42", "#e6762f")
 
-        btn3 = tk.Button(self.root, text="Record Distribution", command=self.open_distribution_screen, **btn_style)
+        btn3 = tk.Button(screen, text="Record Distribution", command=self.open_distribution_screen, **btn_style)
         btn3.pack(pady=8)
         self.add_hover_effect(btn3, "#FF8C42", "#e6762f")
 
-        btn4 = tk.Button(self.root, text="View Inventory", command=self.open_inventory_screen, **btn_style)
+        btn4 = tk.Button(screen, text="View Inventory", command=self.open_inventory_screen, **btn_style)
         btn4.pack(pady=8)
         self.add_hover_effect(btn4, "#FF8C42", "#e6762f")
 
-        btn5 = tk.Button(self.root, text="View Distribution History", command=self.open_history_screen, **btn_style)
+        btn5 = tk.Button(screen, text="View Distribution History", command=self.open_history_screen, **btn_style)
         btn5.pack(pady=8)
         self.add_hover_effect(btn5, "#FF8C42", "#e6762f")
 
-    def open_add_item_screen(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def build_main_menu(self):
+        self.show_screen("main")
 
-        self.root.configure(bg="#FFF7EE")
-        tk.Label(self.root, text="Add Donation / Item", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
+    # ---------- Add item ----------
+
+    def build_add_item_screen(self):
+        screen = self.new_screen("add_item")
+        tk.Label(screen, text="Add Donation / Item", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
 
-        form = tk.Frame(self.root, bg="white")
+        form = tk.Frame(screen, bg="white")
         form.pack(pady=20)
 
         tk.Label(form, text="Item Name:", bg="white", font=("Segoe UI", 13)).pack()
@@ -110,6 +163,8 @@ class PantryApp:
         quantity_entry = tk.Entry(form, font=("Segoe UI", 12))
         quantity_entry.pack(pady=5)
 
+        self.add_item_entries = [name_entry, category_entry, quantity_entry]
+
         def submit_item():
             name = name_entry.get()
             category = category_entry.get()
@@ -123,22 +178,26 @@ class PantryApp:
             messagebox.showinfo("Success", f"Added {quantity} units of {name}.")
             self.build_main_menu()
 
-        btn1 = tk.Button(self.root, text="Add Item", bg="#FF8C42", fg="white", width=20, command=submit_item)
+        btn1 = tk.Button(screen, text="Add Item", bg="#FF8C42", fg="white", width=20, command=submit_item)
         btn1.pack(pady=10)
         self.add_hover_effect(btn1, "#FF8C42", "#e6762f")
 
-        btn2 = tk.Button(self.root, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
+        btn2 = tk.Button(screen, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
         btn2.pack()
         self.add_hover_effect(btn2, "#ccc", "#bbb")
 
-    def open_add_recipient_screen(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def open_add_item_screen(self):
+        for entry in self.add_item_entries:
+            entry.delete(0, tk.END)
+        self.show_screen("add_item")
 
-        self.root.configure(bg="#FFF7EE")
-        tk.Label(self.root, text="Add Recipient", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
+    # ---------- Add recipient ----------
+
+    def build_add_recipient_screen(self):
+        screen = self.new_screen("add_recipient")
+        tk.Label(screen, text="Add Recipient", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
 
-        form = tk.Frame(self.root, bg="white")
+        form = tk.Frame(screen, bg="white")
         form.pack(pady=20)
 
         tk.Label(form, text="Recipient Name:", bg="white", font=("Segoe UI", 13)).pack()
@@ -153,6 +212,8 @@ class PantryApp:
         notes_entry = tk.Entry(form, font=("Segoe UI", 12))
         notes_entry.pack(pady=5)
 
+        self.add_recipient_entries = [name_entry, size_entry, notes_entry]
+
         def submit_recipient():
             name = name_entry.get()
             size = size_entry.get()
@@ -166,76 +227,106 @@ class PantryApp:
             messagebox.showinfo("Success", f"Recipient '{name}' added.")
             self.build_main_menu()
 
-        btn1 = tk.Button(self.root, text="Add Recipient", bg="#FF8C42", fg="white", width=20, command=submit_recipient)
+        btn1 = tk.Button(screen, text="Add Recipient", bg="#FF8C42", fg="white", width=20, command=submit_recipient)
         btn1.pack(pady=10)
         self.add_hover_effect(btn1, "#FF8C42", "#e6762f")
 
-        btn2 = tk.Button(self.root, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
+        btn2 = tk.Button(screen, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
         btn2.pack()
         self.add_hover_effect(btn2, "#ccc", "#bbb")
 
-    def open_inventory_screen(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def open_add_recipient_screen(self):
+        for entry in self.add_recipient_entries:
+            entry.delete(0, tk.END)
+        self.show_screen("add_recipient")
 
-        self.root.configure(bg="#FFF7EE")
-        tk.Label(self.root, text="Inventory List", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
+    # ---------- Inventory ----------
 
-        frame = tk.Frame(self.root, bg="white")
-        frame.pack(pady=10)
+    def build_inventory_screen(self):
+        screen = self.new_screen("inventory")
+        tk.Label(screen, text="Inventory List", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
 
-        inventory = self.system.get_inventory()
+        self.inventory_frame = tk.Frame(screen, bg="white")
+        self.inventory_frame.pack(pady=10)
 
-        if not inventory:
-            tk.Label(frame, text="No items are in inventory currently.", bg="white", font=("Segoe UI", 13)).pack(pady=10)
-        else:
-            for item in inventory:
-                tk.Label(frame, text=f"{item.name} | {item.category} | {item.quantity} units", bg="white", font=("Segoe UI", 13)).pack(pady=5)
+        self.inventory_empty = tk.Label(self.inventory_frame, text="No items are in inventory currently.", bg="white", font=("Segoe UI", 13))
+        # item name -> row label, updated in place on "item" changes
+        self.inventory_rows = {}
 
-        btn = tk.Button(self.root, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
+        btn = tk.Button(screen, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
         btn.pack(pady=15)
         self.add_hover_effect(btn, "#ccc", "#bbb")
 
-    def open_distribution_screen(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
-        self.root.configure(bg="#FFF7EE")
-        tk.Label(self.root, text="Record Distribution", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
+        for item in self.system.get_inventory():
+            self.refresh_inventory_row(item.name)
+        self.update_inventory_empty()
+
+    def inventory_row_text(self, forecast):
+        text = f"{forecast.name} | {forecast.category} | {forecast.quantity} units"
+        if forecast.days_until_stockout is not None:
+            text += f" | ~{forecast.days_until_stockout} days left"
+        return text
+
+    def set_inventory_row(self, forecast):
+        text = self.inventory_row_text(forecast)
+        row = self.inventory_rows.get(forecast.name)
+        if row is None:
+            row = tk.Label(self.inventory_frame, text=text, bg="white", font=("Segoe UI", 13))
+            row.pack(pady=5)
+            self.inventory_rows[forecast.name] = row
+            self.update_inventory_empty()
+        elif row.cget("text") != text:
+            row.configure(text=text)
+
+    def refresh_inventory_row(self, name):
+        forecast = self.system.get_item_forecast(name)
+        if forecast is not None:
+            self.set_inventory_row(forecast)
+
+    def update_inventory_empty(self):
+        if self.inventory_rows:
+            self.inventory_empty.pack_forget()
+        else:
+            self.inventory_empty.pack(pady=10)
 
-        frame = tk.Frame(self.root, bg="white")
-        frame.pack(pady=20)
+    def refresh_inventory_forecasts(self):
+        # Re-forecast once and touch only the rows whose text changed.
+        for forecast in self.system.get_forecast():
+            self.set_inventory_row(forecast)
 
-        tk.Label(frame, text="Recipient:", bg="white", font=("Segoe UI", 13)).pack()
-        recipients = [r.name for r in self.system.recipients]
+    def open_inventory_screen(self):
+        self.show_screen("inventory")
 
-        if not recipients:
-            tk.Label(frame, text="No recipients were found.", bg="white", fg="red").pack()
-            tk.Button(self.root, text="Back", bg="#ccc", command=self.build_main_menu).pack(pady=10)
-            return
+    # ---------- Distribution ----------
 
-        recipient_var = tk.StringVar()
-        ttk.Combobox(frame, textvariable=recipient_var, values=recipients, state="readonly").pack(pady=5)
+    def build_distribution_screen(self):
+        screen = self.new_screen("distribution")
+        tk.Label(screen, text="Record Distribution", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
 
-        tk.Label(frame, text="Item:", bg="white", font=("Segoe UI", 13)).pack()
-        items = [i.name for i in self.system.items]
+        frame = tk.Frame(screen, bg="white")
+        frame.pack(pady=20)
 
-        if not items:
-            tk.Label(frame, text="No items are currently available.", bg="white", fg="red").pack()
-            tk.Button(self.root, text="Back", bg="#ccc", command=self.build_main_menu).pack(pady=10)
-            return
+        tk.Label(frame, text="Recipient:", bg="white", font=("Segoe UI", 13)).pack()
+        self.recipient_var = tk.StringVar()
+        self.recipient_combo = ttk.Combobox(frame, textvariable=self.recipient_var, values=[r.name for r in self.system.recipients], state="readonly")
+        self.recipient_combo.pack(pady=5)
 
-        item_var = tk.StringVar()
-        ttk.Combobox(frame, textvariable=item_var, values=items, state="readonly").pack(pady=5)
+        tk.Label(frame, text="Item:", bg="white", font=("Segoe UI", 13)).pack()
+        self.item_var = tk.StringVar()
+        self.item_combo = ttk.Combobox(frame, textvariable=self.item_var, values=[i.name for i in self.system.items], state="readonly")
+        self.item_combo.pack(pady=5)
 
         tk.Label(frame, text="Quantity:", bg="white", font=("Segoe UI", 13)).pack()
-        qty_entry = tk.Entry(frame, font=("Segoe UI", 12))
-        qty_entry.pack(pady=5)
+        self.qty_entry = tk.Entry(frame, font=("Segoe UI", 12))
+        self.qty_entry.pack(pady=5)
+
+        self.distribution_warning = tk.Label(frame, text="", bg="white", fg="red")
+        self.distribution_warning.pack()
 
         def submit_distribution():
-            r = recipient_var.get()
-            i = item_var.get()
-            q = qty_entry.get()
+            r = self.recipient_var.get()
+            i = self.item_var.get()
+            q = self.qty_entry.get()
 
             if not r or not i or not q.isdigit():
                 messagebox.showerror("Error", "Please ensure that all fields are filled out correctly.")
@@ -243,40 +334,112 @@ class PantryApp:
 
             result = self.system.record_distribution(i, r, int(q))
 
-            if result:
+            if result == "SUCCESS":
                 messagebox.showinfo("Success", f"Gave {q} units of {i} to {r}.")
                 self.build_main_menu()
             else:
-                messagebox.showerror("Error", "Not enough inventory.")
+                messagebox.showerror("Error", result)
 
-        btn1 = tk.Button(self.root, text="Record Distribution", bg="#FF8C42", fg="white", width=20, command=submit_distribution)
-        btn1.pack(pady=10)
-        self.add_hover_effect(btn1, "#FF8C42", "#e6762f")
+        self.distribution_submit = tk.Button(screen, text="Record Distribution", bg="#FF8C42", fg="white", width=20, command=submit_distribution)
+        self.distribution_submit.pack(pady=10)
+        self.add_hover_effect(self.distribution_submit, "#FF8C42", "#e6762f")
 
-        btn2 = tk.Button(self.root, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
+        btn2 = tk.Button(screen, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
         btn2.pack(pady=10)
         self.add_hover_effect(btn2, "#ccc", "#bbb")
 
-    def open_history_screen(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.update_distribution_state()
 
-        self.root.configure(bg="#FFF7EE")
-        tk.Label(self.root, text="Distribution History", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
+    def add_combobox_value(self, combo, value):
+        values = combo.cget("values")
+        if value not in values:
+            combo.configure(values=(*values, value))
+
+    def update_distribution_state(self):
+        if not self.recipient_combo.cget("values"):
+            warning = "No recipients were found."
+        elif not self.item_combo.cget("values"):
+            warning = "No items are currently available."
+        else:
+            warning = ""
+
+        self.distribution_warning.configure(text=warning)
+        self.distribution_submit.configure(state="disabled" if warning else "normal")
+
+    def open_distribution_screen(self):
+        self.recipient_var.set("")
+        self.item_var.set("")
+        self.qty_entry.delete(0, tk.END)
+        self.show_screen("distribution")
+
+    # ---------- History ----------
 
-        frame = tk.Frame(self.root, bg="white")
+    def build_history_screen(self):
+        screen = self.new_screen("history")
+        tk.Label(screen, text="Distribution History", font=("Segoe UI", 20, "bold"), bg="#FFF7EE", fg="#FF8C42").pack(pady=15)
+
+        frame = tk.Frame(screen, bg="white")
         frame.pack(pady=10)
 
-        if not self.system.history:
-            tk.Label(frame, text="No distribution records yet.", bg="white", font=("Segoe UI", 13)).pack(pady=10)
-        else:
-            for record in self.system.history:
-                tk.Label(frame, text=f"{record['recipient']} received {record['quantity']} of {record['item']}", bg="white", font=("Segoe UI", 13)).pack(pady=5)
+        self.history_empty = tk.Label(frame, text="No distribution records yet.", bg="white", font=("Segoe UI", 13))
 
-        btn1 = tk.Button(self.root, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
+        scrollbar = tk.Scrollbar(frame)
+        scrollbar.pack(side="right", fill="y")
+        self.history_list = tk.Listbox(frame, width=50, height=10, font=("Segoe UI", 12), bd=0, yscrollcommand=scrollbar.set)
+        self.history_list.pack(side="left", fill="both")
+        scrollbar.configure(command=self.history_list.yview)
+
+        # Rows are filled on first open, not at startup.
+        self.history_loaded = False
+
+        btn1 = tk.Button(screen, text="Back", bg="#ccc", width=15, command=self.build_main_menu)
         btn1.pack(pady=15)
         self.add_hover_effect(btn1, "#ccc", "#bbb")
 
+    def history_row_text(self, record):
+        return f"{record.get('recipient', '?')} received {record.get('quantity', '?')} of {record.get('item', '?')}"
+
+    def load_history_rows(self):
+        self.history_list.delete(0, tk.END)
+        self.history_list.insert(tk.END, *(self.history_row_text(r) for r in self.system.history))
+        self.history_loaded = True
+        self.update_history_empty()
+
+    def append_history_row(self, record):
+        if not self.history_loaded:
+            return
+        self.history_list.insert(tk.END, self.history_row_text(record))
+        self.history_list.see(tk.END)
+        self.update_history_empty()
+
+    def update_history_empty(self):
+        if self.history_list.size():
+            self.history_empty.pack_forget()
+        else:
+            self.history_empty.pack(side="top", pady=10, before=self.history_list)
+
+    def open_history_screen(self):
+        if not self.history_loaded:
+            self.load_history_rows()
+        self.history_list.see(tk.END)
+        self.show_screen("history")
+
+    # ---------- Full reload ----------
+
+    def reload_data_views(self):
+        for row in self.inventory_rows.values():
+            row.destroy()
+        self.inventory_rows.clear()
+        for item in self.system.get_inventory():
+            self.refresh_inventory_row(item.name)
+        self.update_inventory_empty()
+
+        if self.history_loaded:
+            self.load_history_rows()
+
+        self.recipient_combo.configure(values=[r.name for r in self.system.recipients])
+        self.item_combo.configure(values=[i.name for i in self.system.items])
+
 
 if __name__ == "__main__":
     root = tk.Tk()
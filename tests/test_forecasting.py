@@ -0,0 +1,144 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from backend.models.forecasting import DemandForecaster
+from backend.models.item import Item
+
+MONDAY = date(2026, 10, 5)
+
+
+def record_daily(forecaster, name, start, amounts):
+    """Record amounts[i] units of name on day start + i (zero = no distribution)."""
+    for offset, amount in enumerate(amounts):
+        if amount:
+            when = datetime.combine(start + timedelta(days=offset), datetime.min.time())
+            forecaster.record(name, amount, when.replace(hour=10))
+
+
+def forecast_one(forecaster, item, today):
+    return forecaster.forecast([item], today=today)[0]
+
+
+def test_monday_fixture():
+    assert MONDAY.weekday() == 0
+
+
+def test_unknown_item_has_no_forecast():
+    f = forecast_one(DemandForecaster(), Item("Rice", "Grains", 10), MONDAY)
+    assert f.daily_rate == 0.0
+    assert f.days_until_stockout is None
+    assert f.suggested_reorder == 0
+
+
+def test_single_handout_waits_for_min_history():
+    forecaster = DemandForecaster()
+    record_daily(forecaster, "Rice", MONDAY, [50])
+    item = Item("Rice", "Grains", 10)
+
+    early = MONDAY + timedelta(days=DemandForecaster.MIN_HISTORY_DAYS - 1)
+    f = forecast_one(forecaster, item, early)
+    assert f.daily_rate == 0.0
+    assert f.days_until_stockout is None
+    assert f.suggested_reorder == 0
+
+
+def test_single_handout_rate_after_min_history():
+    forecaster = DemandForecaster(alpha=0.2)
+    record_daily(forecaster, "Rice", MONDAY, [50])
+    item = Item("Rice", "Grains", 10)
+
+    f = forecast_one(forecaster, item, MONDAY + timedelta(days=7))
+    # 50 on day one, then six zero days; bias-corrected EWMA.
+    expected = 50 * 0.2 * 0.8 ** 6 / (1 - 0.8 ** 7)
+    assert f.daily_rate == pytest.approx(expected)
+    # Nothing like the 690 a raw first-day start would suggest.
+    assert f.suggested_reorder < 50
+
+
+def test_new_item_and_reset_item_start_the_same():
+    forecaster = DemandForecaster()
+    pattern = [4, 0, 2, 6, 1, 0, 3, 5, 2]
+    start = MONDAY + timedelta(days=70)
+
+    record_daily(forecaster, "Fresh", start, pattern)
+    # "Returning" had heavy demand long ago, then a gap longer than MAX_GAP_DAYS.
+    record_daily(forecaster, "Returning", MONDAY, [100] * 5)
+    assert (start - MONDAY).days - 5 > DemandForecaster.MAX_GAP_DAYS
+    record_daily(forecaster, "Returning", start, pattern)
+
+    today = start + timedelta(days=len(pattern))
+    fresh = forecast_one(forecaster, Item("Fresh", "X", 20), today)
+    returning = forecast_one(forecaster, Item("Returning", "X", 20), today)
+    assert returning.daily_rate == pytest.approx(fresh.daily_rate)
+    assert returning.days_until_stockout == fresh.days_until_stockout
+    assert returning.suggested_reorder == fresh.suggested_reorder
+
+
+def test_constant_demand():
+    forecaster = DemandForecaster()
+    record_daily(forecaster, "Rice", MONDAY, [3] * 28)
+
+    f = forecast_one(forecaster, Item("Rice", "Grains", 30), MONDAY + timedelta(days=28))
+    assert f.daily_rate == pytest.approx(3.0)
+    assert f.days_until_stockout == 10
+    # 7 days lead time + 7 days cover at 3/day, minus 30 in stock.
+    assert f.suggested_reorder == 12
+
+
+def test_weekday_seasonality():
+    forecaster = DemandForecaster()
+    # Demand only on Saturdays (offset 5 from Monday) for eight weeks.
+    record_daily(forecaster, "Bread", MONDAY, [0, 0, 0, 0, 0, 14, 0] * 8)
+    monday = MONDAY + timedelta(days=56)
+    state = forecaster._projected(forecaster._states["Bread"], monday)
+
+    factors = forecaster._seasonal_factors(state)
+    assert factors[5] == pytest.approx(7.0)
+    assert all(factor == pytest.approx(0.0) for i, factor in enumerate(factors) if i != 5)
+
+    # Stock only runs out when Saturday comes round.
+    f = forecast_one(forecaster, Item("Bread", "Bakery", 1), monday)
+    assert f.days_until_stockout == 5
+
+
+def test_days_until_stockout_spans_weeks():
+    forecaster = DemandForecaster()
+    record_daily(forecaster, "Rice", MONDAY, [2] * 21)
+
+    f = forecast_one(forecaster, Item("Rice", "Grains", 33), MONDAY + timedelta(days=21))
+    assert f.days_until_stockout == 17
+
+
+def test_forecast_does_not_change_state():
+    forecaster = DemandForecaster()
+    record_daily(forecaster, "Rice", MONDAY, [3] * 28)
+    item = Item("Rice", "Grains", 30)
+    today = MONDAY + timedelta(days=28)
+
+    before = forecast_one(forecaster, item, today)
+    forecast_one(forecaster, item, today + timedelta(days=30))
+    assert forecast_one(forecaster, item, today) == before
+
+
+def test_reorder_list_ranks_soonest_stockout_first():
+    forecaster = DemandForecaster()
+    record_daily(forecaster, "Rice", MONDAY, [3] * 14)
+    record_daily(forecaster, "Beans", MONDAY, [5] * 14)
+    items = [Item("Rice", "Grains", 20), Item("Beans", "Canned", 10), Item("Salt", "Misc", 1)]
+
+    ranked = forecaster.reorder_list(items, today=MONDAY + timedelta(days=14))
+    assert [f.name for f in ranked] == ["Beans", "Rice"]
+
+
+def test_load_history_skips_malformed_rows():
+    forecaster = DemandForecaster()
+    forecaster.load_history(
+        [
+            {"item": "Rice", "timestamp": "2026-10-05T10:00:00"},
+            {"item": "Rice", "quantity": "x", "timestamp": "2026-10-05T10:00:00"},
+            {"item": "Beans", "quantity": 2, "timestamp": "not a date"},
+            {"item": "Milk", "quantity": 1, "timestamp": "2026-10-05T10:00:00"},
+        ]
+    )
+    assert set(forecaster._states) == {"Milk"}